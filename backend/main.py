@@ -9,27 +9,106 @@ Author: AI Model Improver Team
 Version: 1.0.0
 """
 
-from fastapi import FastAPI, UploadFile, File, BackgroundTasks, Query, Header
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import (
+    FastAPI,
+    UploadFile,
+    File,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Header,
+    Request,
+)
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from pathlib import Path
+import mimetypes
+import orjson
 import shutil
 import tempfile
 from media_processor import MediaProcessor
+import aiofiles
 import os
-import zipfile
 import uuid
 import asyncio
+import concurrent.futures
+import multiprocessing
 import json
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Any
 
+# Optional inotify support: when available, a watcher thread keeps the
+# caches in sync with the filesystem so endpoints never need to rescan
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# Route all log records through a queue so emission in request handlers
+# is an O(1) enqueue; a single listener thread does the actual stdout
+# writes, keeping the stdio lock off the hot path
+_log_queue: "queue.Queue" = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# force=True evicts any handler installed by imported modules at
+# import time; without it basicConfig is a no-op and records would
+# bypass the queue
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)], force=True)
+logger = logging.getLogger(__name__)
+
+# Chunk size for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Largest accepted upload body (5 GiB); checked against Content-Length
+# before any body bytes are read
+MAX_UPLOAD_BYTES = 5 * 1024 ** 3
+
+def _pool_worker_init() -> None:
+    """
+    Configure logging inside a process-pool worker.
+
+    Spawned workers start with no handlers (and a forked worker would
+    inherit the parent's QueueHandler with no listener thread), so each
+    worker gets a plain stream handler and extraction errors reach
+    stderr instead of vanishing.
+    """
+    logging.basicConfig(level=logging.INFO, force=True)
+
+
+# Two-pool split for background work: compute-bound extraction and
+# media decoding run on the process pool (one worker per core), while
+# blocking filesystem chores (saves, deletes, orchestration waits) go to
+# a thread pool so neither class of task starves the other. The process
+# pool uses the spawn context: workers start lazily, by which point the
+# log listener, IO_POOL and watcher threads are running, and forking a
+# threaded process is a deadlock hazard.
+PROCESS_POOL = concurrent.futures.ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    mp_context=multiprocessing.get_context("spawn"),
+    initializer=_pool_worker_init,
+)
+IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="io")
+
 # Initialize FastAPI application
 app = FastAPI(
     title="AI Model Improver API",
     description="Backend API for AI Model Improver - CoreSet Selection Tool",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes the large /list_* payloads several times faster
+    # than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Directory configuration
@@ -40,8 +119,364 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 ZIP_UPLOAD_DIR = Path("uploads")
 ZIP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-# Mount static files for serving processed images
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Root directory for processed images served under /static. In
+# production set SERVE_STATIC=0 and let the reverse proxy serve /static
+# with kernel sendfile instead of streaming image bytes through Python.
+STATIC_ROOT = Path("static").resolve()
+# Precomputed prefix for the traversal check, so serving a file costs
+# one startswith instead of rebuilding the root string per request
+_STATIC_PREFIX = str(STATIC_ROOT) + os.sep
+
+def _parse_byte_range(header: str, size: int) -> Optional[tuple]:
+    """
+    Parse a single-range bytes= header.
+
+    Args:
+        header (str): Raw Range header value
+        size (int): Total size of the requested file
+
+    Returns:
+        Optional[tuple]: Inclusive (start, end) offsets, or None when
+        the header is malformed, multi-range, or unsatisfiable
+    """
+    if not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, _, end_s = header[6:].partition("-")
+    try:
+        if start_s == "":
+            # Suffix form: the last N bytes
+            length = int(end_s)
+            if length <= 0:
+                return None
+            start = max(size - length, 0)
+            end = size - 1
+        else:
+            start = int(start_s)
+            end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _range_chunks(path: Path, start: int, end: int):
+    """Yield the inclusive byte range [start, end] in 1 MiB chunks."""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+if os.environ.get("SERVE_STATIC", "1") == "1":
+    @app.get("/static/{file_path:path}")
+    def serve_static(file_path: str, request: Request) -> Response:
+        """
+        Serve a static file with conditional-GET and Range support.
+
+        Emits a strong inode/mtime/size ETag and answers matching
+        If-None-Match requests with a bodyless 304, so unchanged gallery
+        images cost no read bandwidth on refresh. Single byte ranges
+        are honored with a 206 partial response (the pinned starlette
+        FileResponse does not handle Range itself); malformed or
+        unsatisfiable ranges get a 416.
+
+        Args:
+            file_path (str): Path relative to the static root
+            request (Request): Incoming request, checked for If-None-Match
+
+        Returns:
+            Response: File contents, 304, or 404
+        """
+        full_path = (STATIC_ROOT / file_path).resolve()
+        if not str(full_path).startswith(_STATIC_PREFIX):
+            return JSONResponse(status_code=404, content={"error": "File not found"})
+        try:
+            st = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return JSONResponse(status_code=404, content={"error": "File not found"})
+
+        etag = f'"{st.st_ino:x}-{int(st.st_mtime):x}-{st.st_size:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "public, max-age=60",
+            "Accept-Ranges": "bytes",
+        }
+        range_header = request.headers.get("range")
+        if range_header is not None:
+            byte_range = _parse_byte_range(range_header, st.st_size)
+            if byte_range is None:
+                headers["Content-Range"] = f"bytes */{st.st_size}"
+                return Response(status_code=416, headers=headers)
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+            media_type = (mimetypes.guess_type(str(full_path))[0]
+                          or "application/octet-stream")
+            return StreamingResponse(
+                _range_chunks(full_path, start, end),
+                status_code=206,
+                headers=headers,
+                media_type=media_type,
+            )
+        return FileResponse(full_path, headers=headers)
+
+# Supported image extensions, hoisted to module scope so per-file
+# checks never rebuild the collection. The tuple form feeds endswith's
+# C-level multi-suffix fast path.
+IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif"})
+_IMG_EXT = tuple(IMAGE_EXTS)
+
+
+def _is_image_name(name: str) -> bool:
+    """Check a filename against the known image extensions."""
+    return name.lower().endswith(_IMG_EXT)
+
+
+# Zip local-file-header signatures: a populated archive starts with
+# PK\x03\x04, an empty one with the end-of-central-directory record
+# PK\x05\x06, and a spanned archive with PK\x07\x08
+_ZIP_MAGICS = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
+
+
+# Leading bytes of the supported image formats (JPEG, PNG, GIF, BMP and
+# both TIFF byte orders), consulted only when a filename has no
+# extension to judge by. Verdicts are cached per inode so each file pays
+# the 12-byte read at most once per process lifetime.
+_IMG_MAGICS = (b"\xff\xd8\xff", b"\x89PNG", b"GIF8", b"BM", b"II*\x00", b"MM\x00*")
+_MAGIC_CACHE: Dict[int, bool] = {}
+
+
+def _is_image_entry(entry: os.DirEntry) -> bool:
+    """
+    Classify a directory entry as an image.
+
+    Files with an extension use the suffix fast path; extensionless
+    files fall back to an inode-cached magic-number sniff, so renamed or
+    extension-stripped images still appear in the index.
+
+    Args:
+        entry (os.DirEntry): Entry from a scandir walk
+
+    Returns:
+        bool: True when the entry holds image content
+    """
+    if "." in entry.name:
+        return _is_image_name(entry.name)
+
+    key = entry.stat(follow_symlinks=False).st_ino
+    cached = _MAGIC_CACHE.get(key)
+    if cached is None:
+        try:
+            with open(entry.path, "rb") as f:
+                cached = f.read(12).startswith(_IMG_MAGICS)
+        except OSError:
+            cached = False
+        _MAGIC_CACHE[key] = cached
+    return cached
+
+
+# In-memory index of processed images: upload_id -> relative file paths.
+# Maintained incrementally at extraction time so read endpoints never
+# have to re-walk the filesystem.
+IMAGE_INDEX: Dict[str, List[str]] = {}
+
+# Version token bumped by every mutating endpoint; cached list responses
+# are valid only while the version is unchanged. The TTL bounds staleness
+# when files change behind the API's back (e.g. manual edits on hosts
+# without the inotify watcher).
+STATE_VERSION = 0
+CACHE_TTL_SECONDS = 5.0
+_LIST_CACHE: Dict[str, Any] = {}
+
+
+def bump_state_version() -> None:
+    """Invalidate cached list responses after a filesystem mutation."""
+    global STATE_VERSION
+    STATE_VERSION += 1
+
+
+def cached_response(key: str) -> Optional[Any]:
+    """
+    Return the cached payload for a list endpoint, if still valid.
+
+    Args:
+        key (str): Cache key, one per endpoint
+
+    Returns:
+        Optional[Any]: Cached payload, or None when stale or missing
+    """
+    entry = _LIST_CACHE.get(key)
+    if (entry is not None
+            and entry[0] == STATE_VERSION
+            and time.monotonic() - entry[1] < CACHE_TTL_SECONDS):
+        return entry[2]
+    return None
+
+
+def store_response(key: str, payload: Any) -> Any:
+    """Cache a list endpoint payload under the current state version."""
+    _LIST_CACHE[key] = (STATE_VERSION, time.monotonic(), payload)
+    return payload
+
+
+# Per-folder listing cache keyed by the folder's mtime, so a mutation in
+# one upload folder only re-walks that folder rather than all of them
+_FOLDER_CACHE: Dict[str, tuple] = {}
+
+
+def _walk_files(root: str):
+    """
+    Recursively yield file DirEntry objects under a directory.
+
+    Uses os.scandir so type checks and stat results come from the cached
+    directory-entry data instead of one syscall per file.
+
+    Args:
+        root (str): Directory to walk
+
+    Yields:
+        os.DirEntry: Entries for regular files under root
+    """
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        # Directory vanished mid-walk (e.g. a tombstone delete running
+        # in the background); report it as empty rather than failing
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+            except FileNotFoundError:
+                continue
+
+
+def rebuild_image_index() -> None:
+    """
+    Rebuild the in-memory image index from disk.
+
+    Performs a single scandir-based walk over all upload folders and
+    repopulates IMAGE_INDEX. Called once at startup so the index stays
+    consistent across process restarts.
+    """
+    global IMAGE_INDEX
+    # Build aside and swap with one assignment: readers on other
+    # threads always see either the old or the new index, never a
+    # half-cleared one (and never a dict mutating under iteration)
+    index: Dict[str, List[str]] = {}
+    with os.scandir(UPLOAD_DIR) as folders:
+        for folder in folders:
+            # Dot-folders are internal (.trash-* deletion tombstones)
+            if folder.name.startswith(".") or not folder.is_dir(follow_symlinks=False):
+                continue
+            base_len = len(folder.path) + 1
+            index[folder.name] = [
+                entry.path[base_len:]
+                for entry in _walk_files(folder.path)
+                if _is_image_entry(entry)
+            ]
+    IMAGE_INDEX = index
+
+
+# Bounded queue of background extraction jobs and their statuses.
+# A fixed set of workers consumes the queue, so background work has
+# predictable concurrency and clients can poll /job/{id} for progress.
+JOB_QUEUE_SIZE = 64
+JOB_WORKERS = 2
+JOB_QUEUE: Optional[asyncio.Queue] = None
+JOBS: Dict[str, Dict[str, Any]] = {}
+
+
+async def job_worker(job_queue: asyncio.Queue, jobs: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Consume queued extraction jobs until cancelled.
+
+    Each job runs extract_zip_background on a worker thread (which in
+    turn uses the process pool), keeping the event loop free and the
+    number of concurrent extractions bounded by the worker count.
+
+    Args:
+        job_queue (asyncio.Queue): Queue of (job_id, zip_path) tuples
+        jobs (Dict[str, Dict[str, Any]]): Shared job-status registry
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        job_id, zip_path = await job_queue.get()
+        jobs[job_id]["status"] = "processing"
+        try:
+            result = await loop.run_in_executor(IO_POOL, extract_zip_background, zip_path)
+            jobs[job_id] = result
+        except Exception as e:
+            jobs[job_id] = {"status": "error", "error": str(e)}
+        finally:
+            job_queue.task_done()
+
+
+@app.on_event("startup")
+async def start_job_workers() -> None:
+    """Create the job queue and start the background worker tasks."""
+    global JOB_QUEUE
+    JOB_QUEUE = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+    for _ in range(JOB_WORKERS):
+        asyncio.create_task(job_worker(JOB_QUEUE, JOBS))
+
+
+def _watch_upload_dirs() -> None:
+    """
+    Mirror filesystem changes into the in-memory state via inotify.
+
+    Runs on a daemon thread. Each batch of create/delete/move events in
+    the watched directories invalidates the list caches and refreshes
+    the image index, so out-of-band changes (e.g. manual deletions) are
+    picked up without per-request rescans.
+    """
+    watcher = INotify()
+    mask = (inotify_flags.CREATE | inotify_flags.DELETE
+            | inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM)
+    watcher.add_watch(str(UPLOAD_DIR), mask)
+    watcher.add_watch(str(ZIP_UPLOAD_DIR), mask)
+    while True:
+        try:
+            if watcher.read():
+                rebuild_image_index()
+                bump_state_version()
+        except OSError as e:
+            # A rebuild can race an in-flight delete or extraction; the
+            # next event retries it, so log and keep the thread alive
+            logger.warning("Upload watcher iteration failed: %s", e)
+            time.sleep(1)
+
+
+@app.on_event("startup")
+def sweep_trash_folders() -> None:
+    """
+    Remove tombstone folders left over from interrupted deletions.
+
+    delete_upload_folder renames folders to a .trash-* tombstone and
+    deletes them in the background; if the process died mid-delete, the
+    tombstones are swept here.
+    """
+    for leftover in UPLOAD_DIR.glob(".trash-*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+
+
+@app.on_event("startup")
+def seed_image_index() -> None:
+    """Seed the image index from disk when the application starts."""
+    rebuild_image_index()
+    if INotify is not None:
+        threading.Thread(target=_watch_upload_dirs, daemon=True).start()
 
 
 def extract_zip_background(zip_path: Path) -> Dict[str, Any]:
@@ -66,63 +501,81 @@ def extract_zip_background(zip_path: Path) -> Dict[str, Any]:
         upload_folder = UPLOAD_DIR / upload_id
         upload_folder.mkdir(parents=True, exist_ok=True)
         
-        print(f"Processing zip file: {zip_path}")
-        print(f"Output folder: {upload_folder}")
+        logger.info("Processing zip file: %s", zip_path)
+        logger.info("Output folder: %s", upload_folder)
         
-        # Use MediaProcessor to handle the extraction and processing
+        # Use MediaProcessor to handle the extraction and processing.
+        # Run it on the process pool so CPU-heavy extraction does not
+        # compete with request handling.
         processor = MediaProcessor(zip_path, upload_folder)
-        all_images = processor.process()
-        
-        print(f"Extraction complete, {len(all_images)} files processed.")
-        print(f"Files saved to: {upload_folder}")
-        
+        all_images = PROCESS_POOL.submit(processor.process).result()
+
+        # Record the processed files in the in-memory index
+        IMAGE_INDEX[upload_id] = [
+            os.path.relpath(image, upload_folder) for image in all_images
+        ]
+        bump_state_version()
+
+        logger.info("Extraction complete, %d files processed.", len(all_images))
+        logger.info("Files saved to: %s", upload_folder)
+
+        # The archive is fully consumed; drop it so every upload does
+        # not permanently double its disk footprint
+        try:
+            zip_path.unlink(missing_ok=True)
+            bump_state_version()
+        except OSError:
+            pass
+
         return {
             "status": "success",
             "upload_id": upload_id,
             "processed_files": len(all_images),
             "output_folder": str(upload_folder)
         }
-        
+
     except Exception as e:
-        print(f"Error during extraction: {e}")
+        logger.error("Error during extraction: %s", e)
         return {
             "status": "error",
             "error": str(e)
         }
 
 
-async def extract_zip_sync(zip_path: Path) -> Dict[str, Any]:
+async def extract_zip_stream(zip_stream) -> Dict[str, Any]:
     """
-    Synchronous version for immediate processing.
-    
-    This function processes the zip file immediately and returns results
-    for real-time feedback to the user.
-    
+    Process a zip archive directly from an in-memory or spooled stream.
+
+    Skips the zip-on-disk copy entirely: the upload stream is handed to
+    MediaProcessor, halving disk writes for synchronous processing.
+
     Args:
-        zip_path (Path): Path to the uploaded zip file
-        
+        zip_stream: Seekable binary file-like object containing the zip
+
     Returns:
         Dict[str, Any]: Processing result with status and file list
-        
-    Raises:
-        Exception: If processing fails
     """
     try:
         # Create a unique folder for this upload
         upload_id = str(uuid.uuid4())
         upload_folder = UPLOAD_DIR / upload_id
         upload_folder.mkdir(parents=True, exist_ok=True)
-        
-        print(f"Processing zip file synchronously: {zip_path}")
-        print(f"Output folder: {upload_folder}")
-        
-        # Use MediaProcessor to handle the extraction and processing
-        processor = MediaProcessor(zip_path, upload_folder)
-        all_images = processor.process()
-        
-        print(f"Extraction complete, {len(all_images)} files processed.")
-        print(f"Files saved to: {upload_folder}")
-        
+
+        logger.info("Processing zip stream -> %s", upload_folder)
+
+        # The stream is not picklable, so run on a worker thread rather
+        # than the process pool
+        processor = MediaProcessor.from_stream(zip_stream, upload_folder)
+        all_images = await asyncio.to_thread(processor.process)
+
+        # Record the processed files in the in-memory index
+        IMAGE_INDEX[upload_id] = [
+            os.path.relpath(image, upload_folder) for image in all_images
+        ]
+        bump_state_version()
+
+        logger.info("Extraction complete, %d files processed.", len(all_images))
+
         return {
             "status": "success",
             "upload_id": upload_id,
@@ -130,18 +583,120 @@ async def extract_zip_sync(zip_path: Path) -> Dict[str, Any]:
             "output_folder": str(upload_folder),
             "files": all_images
         }
-        
+
     except Exception as e:
-        print(f"Error during extraction: {e}")
+        logger.error("Error during extraction: %s", e)
         return {
             "status": "error",
             "error": str(e)
         }
 
 
-@app.post("/upload_zip")
+async def check_upload_size(request: Request) -> None:
+    """
+    Reject oversized uploads before any body bytes are read.
+
+    An honest Content-Length above the limit costs an O(1) header check
+    instead of gigabytes of spooled I/O before failure.
+
+    Args:
+        request (Request): Incoming request, checked for Content-Length
+
+    Raises:
+        HTTPException: 413 when the declared body size exceeds the limit
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            return
+        if declared > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Upload exceeds the {MAX_UPLOAD_BYTES} byte limit"
+            )
+
+
+async def _save_upload_to_disk(file: UploadFile, magic: bytes) -> Path:
+    """
+    Stream an uploaded archive to the uploads directory.
+
+    Single canonical save path shared by both upload endpoints: names
+    the file with a UUID prefix (O(1), race-free under concurrency).
+    When Starlette has already spooled the body to a real temp file,
+    the save is a kernel-side sendfile copy that never moves the bytes
+    through user space; otherwise the body streams to disk in 1 MiB
+    chunks so the event loop stays free.
+
+    Args:
+        file (UploadFile): The uploaded file, already read past the magic
+        magic (bytes): Magic bytes consumed during validation
+
+    Returns:
+        Path: Location of the saved archive
+    """
+    zip_filename = f"{uuid.uuid4().hex}__{Path(file.filename).name}"
+    zip_path = ZIP_UPLOAD_DIR / zip_filename
+
+    spool = getattr(file.file, "_file", None)
+    if (getattr(file.file, "_rolled", False)
+            and spool is not None
+            and hasattr(os, "sendfile")):
+        # The on-disk spool already holds the full body (magic
+        # included), so copy it fd-to-fd from offset zero
+        await asyncio.to_thread(_fast_copy, spool, zip_path)
+        return zip_path
+
+    async with aiofiles.open(zip_path, "wb") as buffer:
+        await buffer.write(magic)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
+    return zip_path
+
+
+def _fast_copy(spool, zip_path: Path) -> None:
+    """
+    Copy a spooled temp file to its destination kernel-side.
+
+    Prefers os.copy_file_range, which stays inside the page cache and
+    can reflink on capable filesystems; falls back to os.sendfile when
+    the kernel or filesystem refuses (EXDEV, ENOSYS).
+    """
+    spool.flush()
+    src_fd = spool.fileno()
+    remaining = os.fstat(src_fd).st_size
+    offset = 0
+    dst_fd = os.open(zip_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "copy_file_range"):
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                # Discard any partial copy and rewind before sendfile
+                os.ftruncate(dst_fd, 0)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                offset = 0
+                remaining = os.fstat(src_fd).st_size
+        while remaining > 0:
+            sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    finally:
+        os.close(dst_fd)
+
+
+@app.post("/upload_zip", dependencies=[Depends(check_upload_size)])
 async def upload_zip(
-    background_tasks: BackgroundTasks, 
     file: UploadFile = File(...),
     process_sync: bool = Query(False, description="Process immediately instead of background")
 ) -> Dict[str, Any]:
@@ -150,9 +705,10 @@ async def upload_zip(
     
     This endpoint handles zip file uploads and processes them either
     synchronously or asynchronously based on the process_sync parameter.
-    
+    Background processing is queued for the job workers; poll /job/{id}
+    with the returned job_id for completion.
+
     Args:
-        background_tasks (BackgroundTasks): FastAPI background tasks
         file (UploadFile): The uploaded zip file
         process_sync (bool): If True, processes immediately and returns results
         
@@ -170,54 +726,73 @@ async def upload_zip(
                 content={"error": "File must be a zip file"}
             )
         
-        # Save zip file to uploads directory with original filename
-        zip_filename = file.filename
-        
-        # Ensure filename is unique
-        counter = 1
-        original_name = zip_filename
-        while (ZIP_UPLOAD_DIR / zip_filename).exists():
-            name_parts = original_name.rsplit('.', 1)
-            if len(name_parts) > 1:
-                zip_filename = f"{name_parts[0]}_{counter}.{name_parts[1]}"
-            else:
-                zip_filename = f"{original_name}_{counter}"
-            counter += 1
-        
-        zip_path = ZIP_UPLOAD_DIR / zip_filename
-        
-        # Save the uploaded file
-        with open(zip_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        print(f"Zip file saved to: {zip_path}")
-        
+        # Sniff the local-file-header magic before any disk write, so a
+        # misnamed upload is rejected without paying for the full body
+        magic = await file.read(4)
+        if magic not in _ZIP_MAGICS:
+            return JSONResponse(
+                status_code=400,
+                content={"error": "File content is not a zip archive"}
+            )
+
         if process_sync:
-            # Process immediately and return results
-            result = await extract_zip_sync(zip_path)
+            # Spool the upload (in memory up to 64 MiB, then on disk
+            # once) and extract straight to the destination folder,
+            # skipping the intermediate zip copy in uploads/
+            with tempfile.SpooledTemporaryFile(max_size=64 << 20) as spool:
+                spool.write(magic)
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+                spool.seek(0)
+                result = await extract_zip_stream(spool)
             return {
                 "status": "success",
-                "message": f"Zip file uploaded and processed immediately.",
-                "filename": zip_filename,
-                "path": str(zip_path),
+                "message": "Zip file processed directly from the upload stream.",
+                "filename": file.filename,
                 "processing_result": result
             }
-        else:
-            # Process in background
-            background_tasks.add_task(extract_zip_background, zip_path)
-            return {
-                "status": "success", 
-                "message": f"Zip file uploaded and saved to {zip_path}. Extraction is processing in the background.",
-                "filename": zip_filename,
-                "path": str(zip_path),
-                "processing": "background"
-            }
-            
+
+        zip_path = await _save_upload_to_disk(file, magic)
+
+        logger.info("Zip file saved to: %s", zip_path)
+        bump_state_version()
+
+        # Enqueue for the background workers; back-pressure applies if
+        # the queue is full
+        job_id = str(uuid.uuid4())
+        JOBS[job_id] = {"status": "queued", "filename": zip_path.name}
+        await JOB_QUEUE.put((job_id, zip_path))
+        return {
+            "status": "success",
+            "message": f"Zip file uploaded and saved to {zip_path}. Extraction is processing in the background.",
+            "filename": zip_path.name,
+            "path": str(zip_path),
+            "processing": "background",
+            "job_id": job_id
+        }
+
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
-@app.post("/process_data")
+@app.get("/job/{job_id}")
+def job_status(job_id: str) -> Dict[str, Any]:
+    """
+    Return the status of a background extraction job.
+
+    Args:
+        job_id (str): Job identifier returned by /upload_zip
+
+    Returns:
+        Dict[str, Any]: Job status, and the processing result once done
+    """
+    job = JOBS.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Job not found"})
+    return job
+
+
+@app.post("/process_data", dependencies=[Depends(check_upload_size)])
 async def process_data(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
@@ -250,33 +825,26 @@ async def process_data(
         if x_process_settings:
             try:
                 processing_settings = json.loads(x_process_settings)
-                print(f"Processing settings received: {processing_settings}")
+                logger.info("Processing settings received: %s", processing_settings)
             except json.JSONDecodeError as e:
-                print(f"Error parsing processing settings: {e}")
+                logger.error("Error parsing processing settings: %s", e)
                 return JSONResponse(
                     status_code=400,
                     content={"error": "Invalid JSON in X-Process-Settings header"}
                 )
         
-        # Save zip file to uploads directory
-        zip_filename = file.filename
-        counter = 1
-        original_name = zip_filename
-        while (ZIP_UPLOAD_DIR / zip_filename).exists():
-            name_parts = original_name.rsplit('.', 1)
-            if len(name_parts) > 1:
-                zip_filename = f"{name_parts[0]}_{counter}.{name_parts[1]}"
-            else:
-                zip_filename = f"{original_name}_{counter}"
-            counter += 1
-        
-        zip_path = ZIP_UPLOAD_DIR / zip_filename
-        
-        # Save the uploaded file
-        with open(zip_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        print(f"Processing data file saved to: {zip_path}")
+        # Peek the zip magic before any bytes hit the disk, so malformed
+        # uploads are rejected without paying for the full ingest
+        magic = await file.read(4)
+        if magic not in _ZIP_MAGICS:
+            return JSONResponse(
+                status_code=400,
+                content={"error": "File content is not a zip archive"}
+            )
+
+        zip_path = await _save_upload_to_disk(file, magic)
+
+        logger.info("Processing data file saved to: %s", zip_path)
         
         # Create a unique folder for this upload
         upload_id = str(uuid.uuid4())
@@ -295,22 +863,31 @@ async def process_data(
         else:
             processor = MediaProcessor(zip_path, upload_folder)
         
-        # Process the file
-        all_images = processor.process()
+        # Process the file on the process pool; the handler only awaits,
+        # so the event loop keeps serving other requests
+        loop = asyncio.get_running_loop()
+        all_images = await loop.run_in_executor(PROCESS_POOL, processor.process)
+
+        # Record the processed files in the in-memory index
+        IMAGE_INDEX[upload_id] = [
+            os.path.relpath(image, upload_folder) for image in all_images
+        ]
+        bump_state_version()
         
-        # Store processing settings for future reference
+        # Store processing settings for future reference; written via
+        # aiofiles so the handler never blocks the event loop on disk
         settings_file = upload_folder / "processing_settings.json"
-        with open(settings_file, 'w') as f:
-            json.dump(processing_settings, f, indent=2)
+        async with aiofiles.open(settings_file, 'w') as f:
+            await f.write(json.dumps(processing_settings, indent=2))
         
-        print(f"Data processing complete, {len(all_images)} files processed.")
-        print(f"Files saved to: {upload_folder}")
-        print(f"Processing settings: {processing_settings}")
+        logger.info("Data processing complete, %d files processed.", len(all_images))
+        logger.info("Files saved to: %s", upload_folder)
+        logger.info("Processing settings: %s", processing_settings)
         
         return {
             "status": "success",
             "message": "Data processed successfully with model settings",
-            "filename": zip_filename,
+            "filename": zip_path.name,
             "path": str(zip_path),
             "upload_id": upload_id,
             "processed_files": len(all_images),
@@ -321,11 +898,11 @@ async def process_data(
         }
         
     except Exception as e:
-        print(f"Error during data processing: {e}")
+        logger.error("Error during data processing: %s", e)
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
-@app.get("/list_uploads")
+@app.get("/list_uploads", response_class=ORJSONResponse)
 def list_uploads() -> Dict[str, List[str]]:
     """
     List all uploaded zip files.
@@ -333,62 +910,119 @@ def list_uploads() -> Dict[str, List[str]]:
     Returns:
         Dict[str, List[str]]: List of uploaded zip file names
     """
-    zip_files = [f.name for f in ZIP_UPLOAD_DIR.glob("*.zip")]
-    return {"uploads": zip_files}
+    cached = cached_response("uploads")
+    if cached is not None:
+        return cached
+    with os.scandir(ZIP_UPLOAD_DIR) as entries:
+        zip_files = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".zip") and entry.is_file(follow_symlinks=False)
+        ]
+    return store_response("uploads", {"uploads": zip_files})
 
 
-@app.get("/list_images")
+@app.get("/list_images", response_class=ORJSONResponse)
 def list_images() -> Dict[str, List[str]]:
     """
     List all processed images from all uploads.
     
-    Scans all upload folders and returns paths to all processed images
-    for display in the frontend gallery.
-    
+    Serves the in-memory image index maintained at extraction time, so
+    no filesystem walk is needed per request.
+
     Returns:
         Dict[str, List[str]]: List of image URLs for the frontend
     """
-    all_images = []
-    for upload_folder in UPLOAD_DIR.iterdir():
-        if upload_folder.is_dir():
-            for image_file in upload_folder.rglob("*"):
-                if image_file.is_file() and image_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif']:
-                    # Return relative path from static/images
-                    relative_path = image_file.relative_to(UPLOAD_DIR)
-                    all_images.append(f"/static/images/{relative_path}")
-    
-    return {"images": all_images}
+    cached = cached_response("images")
+    if cached is not None:
+        return cached
+    # Snapshot the items: extraction threads and the inotify watcher
+    # mutate the index concurrently with this threadpool endpoint
+    all_images = [
+        f"/static/images/{upload_id}/{relative_path}"
+        for upload_id, files in list(IMAGE_INDEX.items())
+        for relative_path in files
+    ]
+    return store_response("images", {"images": all_images})
 
 
 @app.get("/list_upload_folders")
-def list_upload_folders() -> Dict[str, List[Dict[str, Any]]]:
+def list_upload_folders() -> StreamingResponse:
     """
     List all upload folders with their contents.
-    
+
     Provides detailed information about each upload folder including
-    file names, paths, and sizes for management purposes.
-    
+    file names, paths, and sizes for management purposes. The response
+    body is streamed one orjson-encoded folder at a time, so a listing
+    covering hundreds of thousands of files never materializes as a
+    single JSON string in memory.
+
     Returns:
-        Dict[str, List[Dict[str, Any]]]: Detailed folder information
+        StreamingResponse: JSON object with the upload_folders array
     """
+    folders = cached_response("upload_folders")
+    if folders is not None:
+        return _stream_folders(folders)
     folders = []
-    for upload_folder in UPLOAD_DIR.iterdir():
-        if upload_folder.is_dir():
+    seen = set()
+    with os.scandir(UPLOAD_DIR) as upload_folders:
+        for upload_folder in upload_folders:
+            # Dot-folders are internal (.trash-* deletion tombstones)
+            if (upload_folder.name.startswith(".")
+                    or not upload_folder.is_dir(follow_symlinks=False)):
+                continue
+            seen.add(upload_folder.name)
+
+            # Re-walk a folder only when its mtime changed; unchanged
+            # folders are served from the per-folder cache
+            mtime_ns = upload_folder.stat(follow_symlinks=False).st_mtime_ns
+            cached_folder = _FOLDER_CACHE.get(upload_folder.name)
+            if cached_folder is not None and cached_folder[0] == mtime_ns:
+                folders.append(cached_folder[1])
+                continue
+
+            base_len = len(upload_folder.path) + 1
             folder_info = {
                 "folder_id": upload_folder.name,
-                "folder_path": str(upload_folder),
-                "files": []
+                "folder_path": upload_folder.path,
+                "files": [
+                    {
+                        "name": entry.name,
+                        "path": entry.path[base_len:],
+                        # follow_symlinks=False reuses the stat result
+                        # cached on the DirEntry; the default re-stats
+                        "size": entry.stat(follow_symlinks=False).st_size
+                    }
+                    for entry in _walk_files(upload_folder.path)
+                ]
             }
-            for file_path in upload_folder.rglob("*"):
-                if file_path.is_file():
-                    folder_info["files"].append({
-                        "name": file_path.name,
-                        "path": str(file_path.relative_to(upload_folder)),
-                        "size": file_path.stat().st_size
-                    })
+            _FOLDER_CACHE[upload_folder.name] = (mtime_ns, folder_info)
             folders.append(folder_info)
-    
-    return {"upload_folders": folders}
+
+    # Drop cache entries for folders deleted since the last listing
+    for stale in set(_FOLDER_CACHE) - seen:
+        del _FOLDER_CACHE[stale]
+
+    store_response("upload_folders", folders)
+    return _stream_folders(folders)
+
+
+def _folder_chunks(folders: List[Dict[str, Any]]):
+    """Yield the folder listing as chunked JSON, one folder per chunk."""
+    yield b'{"upload_folders":['
+    first = True
+    for folder in folders:
+        if first:
+            first = False
+        else:
+            yield b","
+        yield orjson.dumps(folder)
+    yield b"]}"
+
+
+def _stream_folders(folders: List[Dict[str, Any]]) -> StreamingResponse:
+    """Stream the folder list as chunked JSON without a full-body buffer."""
+    return StreamingResponse(_folder_chunks(folders), media_type="application/json")
 
 
 @app.delete("/delete_image")
@@ -405,6 +1039,14 @@ def delete_image(filename: str) -> Dict[str, str]:
     file_path = UPLOAD_DIR / filename
     if file_path.exists():
         file_path.unlink()
+        # Drop the file from the in-memory index too: /list_images is
+        # served from IMAGE_INDEX, so an unlink alone would leave the
+        # deleted image in every listing until the next full rebuild
+        upload_id, _, relative_path = filename.partition("/")
+        indexed = IMAGE_INDEX.get(upload_id)
+        if indexed is not None and relative_path in indexed:
+            indexed.remove(relative_path)
+        bump_state_version()
         return {"status": "deleted"}
     return JSONResponse(status_code=404, content={"error": "File not found"})
 
@@ -423,54 +1065,104 @@ def delete_upload(filename: str) -> Dict[str, str]:
     file_path = ZIP_UPLOAD_DIR / filename
     if file_path.exists():
         file_path.unlink()
+        bump_state_version()
         return {"status": "deleted"}
     return JSONResponse(status_code=404, content={"error": "File not found"})
 
 
 @app.delete("/delete_upload_folder")
-def delete_upload_folder(folder_id: str) -> Dict[str, str]:
+def delete_upload_folder(folder_id: str, background_tasks: BackgroundTasks) -> Dict[str, str]:
     """
     Delete an entire upload folder and its contents.
-    
+
+    The folder is atomically renamed to a tombstone and removed in the
+    background, so the response returns after a single rename syscall
+    instead of waiting for thousands of unlinks.
+
     Args:
         folder_id (str): ID of the folder to delete
-        
+
     Returns:
         Dict[str, str]: Deletion status
     """
     folder_path = UPLOAD_DIR / folder_id
     if folder_path.exists() and folder_path.is_dir():
-        shutil.rmtree(folder_path)
+        tombstone = UPLOAD_DIR / f".trash-{folder_id}-{uuid.uuid4().hex}"
+        os.rename(folder_path, tombstone)
+        IMAGE_INDEX.pop(folder_id, None)
+        bump_state_version()
+        IO_POOL.submit(shutil.rmtree, tombstone, ignore_errors=True)
         return {"status": "deleted", "folder_id": folder_id}
     return JSONResponse(status_code=404, content={"error": "Folder not found"})
 
 
+def _curation_result(
+    dataset_path: str,
+    model_name: str,
+    prune_factor: float
+) -> Dict[str, Any]:
+    """
+    Build the model-improvement result payload.
+
+    Plain sync helper so internal callers get the result as a direct
+    dict construction with no coroutine scheduling or route-layer
+    keyword binding in between.
+
+    Args:
+        dataset_path (str): Path to the dataset
+        model_name (str): Name of the model to improve
+        prune_factor (float): Prune factor for data selection (0.0-1.0)
+
+    Returns:
+        Dict[str, Any]: Training status and parameters
+    """
+    return {
+        "status": "success",
+        "dataset": dataset_path,
+        "model": model_name,
+        "prune_factor": prune_factor
+    }
+
+
 @app.post("/improve_model")
 async def improve_model(
-    dataset_path: str, 
-    model_name: str, 
+    dataset_path: str,
+    model_name: str,
     prune_factor: float
 ) -> Dict[str, Any]:
     """
     Trigger model improvement with specified parameters.
-    
+
     This endpoint receives training parameters and initiates the model
     improvement process. Updated to use prune_factor instead of sampling_factor.
-    
+
     Args:
         dataset_path (str): Path to the dataset
         model_name (str): Name of the model to improve
         prune_factor (float): Prune factor for data selection (0.0-1.0)
-        
+
     Returns:
         Dict[str, Any]: Training status and parameters
     """
-    return {
-        "status": "success", 
-        "dataset": dataset_path, 
-        "model": model_name, 
-        "prune_factor": prune_factor
-    }
+    return _curation_result(dataset_path, model_name, prune_factor)
+
+
+@app.get("/signed_image/{image_path:path}")
+def signed_image(image_path: str) -> Response:
+    """
+    Delegate image delivery to the reverse proxy.
+
+    Returns an X-Accel-Redirect header pointing at nginx's internal
+    static location, so the image bytes are sent with kernel sendfile
+    and never stream through the Python process.
+
+    Args:
+        image_path (str): Image path relative to static/images
+
+    Returns:
+        Response: Empty response carrying the X-Accel-Redirect header
+    """
+    return Response(headers={"X-Accel-Redirect": f"/internal/{image_path}"})
 
 
 @app.get("/health")
@@ -486,4 +1178,16 @@ def health_check() -> Dict[str, str]:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8050)
\ No newline at end of file
+    # uvloop + httptools give 2-3x request throughput over the default
+    # asyncio loop. Workers default to 1 because the image index, list
+    # caches and job queue are per-process; raise WEB_CONCURRENCY once
+    # that state is moved behind Redis or similar.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8050,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        backlog=4096
+    )
\ No newline at end of file
@@ -10,19 +10,155 @@ Version: 1.0.0
 """
 
 import zipfile
-import os
 import shutil
+import multiprocessing
+import concurrent.futures
+import io
+import mmap
+import os
+import re
+import struct
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import imageio
 import imageio_ffmpeg
+import numpy as np
 import uuid
 import logging
+import queue
+import threading
+
+from uring_io import UringWriter
+
+# Swap zipfile's DEFLATE backend for ISA-L's SIMD-accelerated
+# implementation when available: ~3x faster inflate and near-free CRC32
+# verification on x86-64. Must happen before any ZipFile is created.
+try:
+    from isal import isal_zlib
+    zipfile.zlib = isal_zlib
+except ImportError:
+    pass
+
+# Optional libjpeg-turbo frame encoder: SIMD (AVX2/NEON) JPEG encoding
+# runs 2-4x faster than Pillow's at the same quality. One shared
+# instance; PyTurboJPEG.encode is thread-safe.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+# Optional PyAV decoder: binds libav directly, enables FFmpeg's
+# internal multithreaded decode and releases the GIL inside decode(),
+# so several videos truly decode in parallel across worker threads.
+try:
+    import av
+except ImportError:
+    av = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point; configuring it
+# here at import time would claim the root logger before main.py can
+# install its queue-backed handlers
 logger = logging.getLogger(__name__)
 
+# Pool of reusable 1 MiB copy buffers shared across all extractions, so
+# copying a member costs zero allocations instead of GC-churning a fresh
+# buffer per file. The pool is bounded so a burst of concurrent
+# extractions cannot pin its high-water mark for the process lifetime.
+_COPY_BUFFER_SIZE = 1 << 20
+_BUFFER_POOL_MAX = 2 * (os.cpu_count() or 1)
+_BUFFER_POOL: "queue.Queue" = queue.Queue(maxsize=_BUFFER_POOL_MAX)
+
+# Queued io_uring writes hold their buffer until drained; drain and
+# recycle after this many, capping in-flight copy memory per thread
+_BUFFER_DRAIN_BATCH = 16
+
+# Video entries up to this size are decoded straight from memory when
+# PyAV is available, skipping the temp-file write/read round-trip
+_VIDEO_SPOOL_MAX = 256 << 20
+
+
+def _buffer_checkout() -> bytearray:
+    """Take a pooled copy buffer, allocating one only when the pool is dry."""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_COPY_BUFFER_SIZE)
+
+
+def _buffer_return(buf: bytearray) -> None:
+    """Return a buffer to the pool, dropping it when the pool is full."""
+    try:
+        _BUFFER_POOL.put_nowait(buf)
+    except queue.Full:
+        pass
+
+
+def _write_jpeg(frame_path, frame) -> None:
+    """Encode a frame to JPEG, preferring the libjpeg-turbo encoder."""
+    if _turbo_jpeg is not None:
+        with open(frame_path, "wb") as f:
+            f.write(_turbo_jpeg.encode(frame, quality=85, pixel_format=TJPF_RGB))
+    else:
+        imageio.imwrite(frame_path, frame)
+
+
+# JPEG encoding is CPU-bound, so frames go to a shared encoder pool,
+# created lazily so importing the module never starts workers. In the
+# main process this is a spawn-context process pool: spawned children
+# do not inherit the parent's running threads, avoiding the
+# fork-with-threads deadlock. When extraction itself already runs
+# inside a process-pool worker, another process pool per worker would
+# multiply to cpu_count^2 encoder processes, so frames encode on a
+# small thread pool there instead — TurboJPEG and the imageio writers
+# release the GIL while encoding.
+_ENCODER_POOL: Optional[concurrent.futures.Executor] = None
+_ENCODER_POOL_LOCK = threading.Lock()
+
+
+def _encoder_pool() -> concurrent.futures.Executor:
+    """Return the shared frame-encoder pool, creating it once."""
+    global _ENCODER_POOL
+    if _ENCODER_POOL is None:
+        with _ENCODER_POOL_LOCK:
+            if _ENCODER_POOL is None:
+                if multiprocessing.parent_process() is not None:
+                    _ENCODER_POOL = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(4, os.cpu_count() or 1),
+                        thread_name_prefix="frame"
+                    )
+                else:
+                    _ENCODER_POOL = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=os.cpu_count(),
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+    return _ENCODER_POOL
+
+
+def _scandir_recursive(path):
+    """
+    Recursively yield file DirEntry objects under a directory.
+
+    DirEntry caches the type information from the directory read, so
+    dispatching on is_dir/is_file costs no extra stat syscalls per
+    entry. Symlinks are skipped.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        os.DirEntry: Entries for regular files under path
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            else:
+                yield entry
+
 
 class MediaProcessor:
     """
@@ -44,6 +180,14 @@ class MediaProcessor:
         frame_interval (int): Interval between extracted frames (in seconds)
     """
     
+    # One precompiled DFA for suffix dispatch: a single match call
+    # classifies an entry as image or video via named groups, with no
+    # per-entry slicing or set lookups
+    _MEDIA_RE = re.compile(
+        r'\.(?:(?P<img>jpe?g|png|bmp|tiff?|gif)|(?P<vid>mp4|avi|mov|mkv|wmv|flv))$',
+        re.IGNORECASE
+    )
+
     def __init__(
         self, 
         zip_path: Path, 
@@ -60,7 +204,8 @@ class MediaProcessor:
             max_frames_per_video (int): Maximum number of frames to extract per video
             frame_interval (int): Interval between extracted frames in seconds
         """
-        self.zip_path = Path(zip_path)
+        self.zip_path = Path(zip_path) if zip_path is not None else None
+        self.zip_stream = None
         self.output_dir = Path(output_dir)
         self.max_frames_per_video = max_frames_per_video
         self.frame_interval = frame_interval
@@ -71,231 +216,521 @@ class MediaProcessor:
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Cached string form of output_dir: frame paths are built with
+        # plain string formatting to skip per-frame Path construction
+        self._out_str = os.fspath(self.output_dir)
         
-        logger.info(f"MediaProcessor initialized for {zip_path} -> {output_dir}")
-    
+        logger.info("MediaProcessor initialized for %s -> %s", zip_path, output_dir)
+
+    @classmethod
+    def from_stream(
+        cls,
+        zip_stream,
+        output_dir: Path,
+        max_frames_per_video: int = 100,
+        frame_interval: int = 1
+    ) -> "MediaProcessor":
+        """
+        Create a MediaProcessor that reads the zip from a file-like object.
+
+        Avoids writing the uploaded archive to disk before extraction;
+        the stream (e.g. a SpooledTemporaryFile) is consumed directly.
+
+        Args:
+            zip_stream: Seekable binary file-like object containing the zip
+            output_dir (Path): Directory where processed files will be saved
+            max_frames_per_video (int): Maximum number of frames to extract per video
+            frame_interval (int): Interval between extracted frames in seconds
+
+        Returns:
+            MediaProcessor: Processor bound to the stream instead of a path
+        """
+        processor = cls(
+            None,
+            output_dir,
+            max_frames_per_video=max_frames_per_video,
+            frame_interval=frame_interval
+        )
+        processor.zip_stream = zip_stream
+        return processor
+
     def process(self) -> List[str]:
         """
         Process the zip file and extract all media files.
-        
-        This method orchestrates the entire processing pipeline:
-        1. Extract the zip file
-        2. Identify images and videos
-        3. Copy images to output directory
-        4. Extract frames from videos
-        5. Return list of all processed files
-        
+
+        Streams each archive entry directly to its destination in a
+        single pass: images land in the output directory under unique
+        names, videos spool to a temporary file only long enough for
+        frame extraction. No intermediate extraction directory exists,
+        so every byte is read and written exactly once.
+
         Returns:
             List[str]: List of paths to all processed files
-            
+
         Raises:
             Exception: If processing fails at any step
         """
         try:
-            logger.info(f"Starting processing of {self.zip_path}")
-            
-            # Extract zip file to temporary directory
-            temp_dir = self._extract_zip()
-            
-            # Process all files in the extracted directory
-            processed_files = self._process_files(temp_dir)
-            
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir)
-            
-            logger.info(f"Processing complete. {len(processed_files)} files processed.")
+            logger.info("Starting processing of %s", self.zip_path)
+
+            if self.zip_stream is not None:
+                processed_files = self._process_stream_archive()
+                # The stream is fully consumed; drop it so the processor
+                # stays picklable for pool workers
+                self.zip_stream = None
+            else:
+                processed_files = self._process_path_archive()
+
+            logger.info("Processing complete. %d files processed.", len(processed_files))
             return processed_files
-            
+
         except Exception as e:
-            logger.error(f"Error during processing: {e}")
+            logger.error("Error during processing: %s", e)
             raise
-    
-    def _extract_zip(self) -> Path:
+
+    def _process_stream_archive(self) -> List[str]:
         """
-        Extract the zip file to a temporary directory.
-        
-        Creates a temporary directory and extracts all contents of the zip file.
-        Handles nested directories and maintains the original structure.
-        
+        Process members sequentially from an in-memory zip stream.
+
+        Stream-backed archives have a single shared file object, so
+        members are handled one at a time.
+
         Returns:
-            Path: Path to the temporary extraction directory
-            
-        Raises:
-            Exception: If zip extraction fails
+            List[str]: Paths of all files produced
         """
-        temp_dir = Path(f"/tmp/zip_extract_{uuid.uuid4()}")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        
+        processed_files = []
+        writer = UringWriter()
         try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            logger.info(f"Zip file extracted to {temp_dir}")
-            return temp_dir
-            
-        except Exception as e:
-            logger.error(f"Failed to extract zip file: {e}")
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            raise
-    
-    def _process_files(self, temp_dir: Path) -> List[str]:
+            with zipfile.ZipFile(self.zip_stream, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    processed_files.extend(
+                        self._process_member(zip_ref, info, writer)
+                    )
+        finally:
+            writer.close()
+        return processed_files
+
+    def _process_path_archive(self) -> List[str]:
         """
-        Process all files in the temporary directory.
-        
-        Walks through all files in the extracted directory, identifies
-        images and videos, and processes them accordingly.
-        
-        Args:
-            temp_dir (Path): Path to the temporary extraction directory
-            
+        Process all members concurrently from a path-backed archive.
+
+        Inflate releases the GIL inside zlib and frame extraction lives
+        in FFmpeg, so one worker thread per core parallelizes the whole
+        pipeline. ZipFile objects are not safe for concurrent open(), so
+        each thread keeps its own archive handle (mmap-backed where
+        possible) plus its own write backend in thread-local storage.
+
         Returns:
-            List[str]: List of paths to all processed files
+            List[str]: Paths of all files produced
         """
-        processed_files = []
-        
-        # Walk through all files in the extracted directory
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                file_path = Path(root) / file
-                file_extension = file_path.suffix.lower()
-                
+        with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+
+        local = threading.local()
+        resources = []
+        resources_lock = threading.Lock()
+
+        def thread_state():
+            if not hasattr(local, "zip_ref"):
+                zip_fd = os.open(self.zip_path, os.O_RDONLY)
                 try:
-                    if file_extension in self.supported_image_extensions:
-                        # Process image file
-                        processed_path = self._process_image(file_path)
-                        if processed_path:
-                            processed_files.append(str(processed_path))
-                            
-                    elif file_extension in self.supported_video_extensions:
-                        # Process video file
-                        video_frames = self._process_video(file_path)
-                        processed_files.extend([str(frame_path) for frame_path in video_frames])
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path}: {e}")
-                    continue
-        
+                    zip_map = mmap.mmap(zip_fd, 0, access=mmap.ACCESS_READ)
+                    zip_source = zip_map
+                except (ValueError, OSError):
+                    zip_map = None
+                    zip_source = self.zip_path
+                local.zip_fd = zip_fd
+                local.zip_ref = zipfile.ZipFile(zip_source, 'r')
+                local.writer = UringWriter()
+                with resources_lock:
+                    resources.append((local.zip_ref, local.writer, zip_map, zip_fd))
+            return local
+
+        def process_one(info):
+            state = thread_state()
+            return self._process_member(state.zip_ref, info, state.writer, state.zip_fd)
+
+        processed_files = []
+        max_workers = os.cpu_count() or 1
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="zip"
+            ) as pool:
+                for result in pool.map(process_one, infos):
+                    processed_files.extend(result)
+        finally:
+            for zip_ref, writer, zip_map, zip_fd in resources:
+                writer.close()
+                zip_ref.close()
+                if zip_map is not None:
+                    zip_map.close()
+                os.close(zip_fd)
         return processed_files
-    
-    def _process_image(self, image_path: Path) -> Optional[Path]:
+
+    def _process_member(
+        self,
+        zip_ref: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        writer: UringWriter,
+        zip_fd: Optional[int] = None
+    ) -> List[str]:
         """
-        Process an image file by copying it to the output directory.
-        
-        Creates a unique filename to avoid conflicts and copies the image
-        to the output directory with proper error handling.
-        
+        Process a single archive member by suffix dispatch.
+
+        Output names are built from the entry basename plus a UUID, so
+        entry paths never touch the filesystem and zip-slip traversal is
+        structurally impossible.
+
         Args:
-            image_path (Path): Path to the source image file
-            
+            zip_ref (zipfile.ZipFile): Open zip archive
+            info (zipfile.ZipInfo): Entry to process
+            writer (UringWriter): Batched write backend
+            zip_fd (Optional[int]): Raw archive fd for the sendfile path
+
         Returns:
-            Optional[Path]: Path to the copied image file, or None if failed
+            List[str]: Paths of the files produced for this entry
+        """
+        if info.is_dir():
+            return []
+
+        # One regex match classifies the entry; junk entries common in
+        # user zips (__MACOSX, .DS_Store, text files) exit immediately
+        match = self._MEDIA_RE.search(info.filename)
+        if match is None:
+            return []
+
+        if match.group('img'):
+            processed_path = self._copy_image_entry(zip_ref, info, writer, zip_fd)
+            return [str(processed_path)] if processed_path else []
+
+        return self._process_video_entry(zip_ref, info, writer, zip_fd)
+
+    def _copy_image_entry(
+        self,
+        zip_ref: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        writer: UringWriter,
+        zip_fd: Optional[int] = None
+    ) -> Optional[Path]:
+        """
+        Stream an image entry straight into the output directory.
+
+        Args:
+            zip_ref (zipfile.ZipFile): Open zip archive
+            info (zipfile.ZipInfo): Image entry to copy
+            writer (UringWriter): Batched write backend
+            zip_fd (Optional[int]): Raw archive fd for the sendfile path
+
+        Returns:
+            Optional[Path]: Path to the copied image, or None if failed
         """
         try:
             # Create unique filename to avoid conflicts
-            unique_filename = f"{uuid.uuid4()}_{image_path.name}"
+            unique_filename = f"{uuid.uuid4().hex}_{os.path.basename(info.filename)}"
             output_path = self.output_dir / unique_filename
-            
-            # Copy the image file
-            shutil.copy2(image_path, output_path)
-            
-            logger.debug(f"Image processed: {image_path.name} -> {unique_filename}")
+
+            self._write_entry(zip_ref, info, output_path, writer, zip_fd)
+
+            logger.debug("Image processed: %s -> %s", info.filename, unique_filename)
             return output_path
-            
+
         except Exception as e:
-            logger.error(f"Failed to process image {image_path}: {e}")
+            logger.error("Failed to process image %s: %s", info.filename, e)
             return None
-    
-    def _process_video(self, video_path: Path) -> List[Path]:
+
+    def _process_video_entry(
+        self,
+        zip_ref: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        writer: UringWriter,
+        zip_fd: Optional[int] = None
+    ) -> List[str]:
+        """
+        Spool a video entry to a temporary file and extract its frames.
+
+        The decoder needs a seekable file, so the entry is written once
+        to a named temp file that lives only for the duration of frame
+        extraction.
+
+        Args:
+            zip_ref (zipfile.ZipFile): Open zip archive
+            info (zipfile.ZipInfo): Video entry to process
+            writer (UringWriter): Batched write backend
+            zip_fd (Optional[int]): Raw archive fd for the sendfile path
+
+        Returns:
+            List[str]: Paths of the extracted frame images
+        """
+        # PyAV accepts a file object, so the entry streams through a
+        # spooled temp file: small videos decode from memory, huge ones
+        # roll to disk, and no path materializes the whole payload in
+        # one allocation
+        if av is not None:
+            logger.info("Processing video: %s", info.filename)
+            video_prefix = f"{uuid.uuid4().hex}_{Path(info.filename).stem}"
+            try:
+                with tempfile.SpooledTemporaryFile(max_size=_VIDEO_SPOOL_MAX) as spool:
+                    with zip_ref.open(info) as raw:
+                        shutil.copyfileobj(raw, spool, _COPY_BUFFER_SIZE)
+                    spool.seek(0)
+                    return self._extract_frames_pyav(spool, video_prefix)
+            except Exception as e:
+                logger.error("Failed to process video %s: %s", info.filename, e)
+                return []
+
+        # Large entries (or no PyAV) spool to a named temp file, since
+        # the pipe decoder needs a real path
+        tmp_fd, tmp_name = tempfile.mkstemp(
+            suffix=f"_{os.path.basename(info.filename)}"
+        )
+        os.close(tmp_fd)
+        tmp_path = Path(tmp_name)
+        try:
+            self._write_entry(zip_ref, info, tmp_path, writer, zip_fd)
+            return self._process_video(tmp_path)
+        except Exception as e:
+            # Per-entry failures must not abort the whole archive
+            logger.error("Failed to process video %s: %s", info.filename, e)
+            return []
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _write_entry(
+        self,
+        zip_ref: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        target: Path,
+        writer: UringWriter,
+        zip_fd: Optional[int] = None
+    ) -> None:
+        """
+        Write one zip entry's bytes to a target path.
+
+        Stored (uncompressed) entries are copied kernel-side with
+        sendfile straight from the archive fd. Compressed entries stream
+        through pooled buffers into positional writes queued on the
+        UringWriter, so writes across many small entries share syscalls.
+
+        Args:
+            zip_ref (zipfile.ZipFile): Open zip archive
+            info (zipfile.ZipInfo): Entry to write out
+            target (Path): Destination file path
+            writer (UringWriter): Batched write backend
+            zip_fd (Optional[int]): Raw archive fd for the sendfile path
+        """
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if (info.compress_type == zipfile.ZIP_STORED
+                    and zip_fd is not None
+                    and hasattr(os, "sendfile")):
+                # Stored entries need no inflation: copy the raw bytes
+                # kernel-side without touching user space
+                offset = self._stored_data_offset(zip_fd, info)
+                remaining = info.file_size
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(fd, zip_fd, offset, remaining)
+                        if sent == 0:
+                            break
+                        offset += sent
+                        remaining -= sent
+                    return
+                except OSError:
+                    # Filesystem refused sendfile (e.g. EINVAL on some
+                    # mounts); discard any partial copy and fall through
+                    # to the streamed path
+                    os.ftruncate(fd, 0)
+
+            offset = 0
+            # Pooled buffers back every queued write. The synchronous
+            # pwrite fallback reuses a single buffer for the whole
+            # entry; queued io_uring writes hold theirs only until the
+            # next drain boundary, so in-flight copy memory stays capped
+            # instead of growing with the entry size
+            used_buffers = []
+            buf = _buffer_checkout()
+            try:
+                with zip_ref.open(info) as raw:
+                    # Buffer the inflate stream so the decoder works on
+                    # 64 KiB units instead of zipfile's small default reads
+                    source = io.BufferedReader(raw, buffer_size=65536)
+                    view = memoryview(buf)
+                    while n := source.readinto(view):
+                        writer.submit_write(fd, view[:n], offset)
+                        offset += n
+                        if writer.synchronous:
+                            continue
+                        used_buffers.append(buf)
+                        if len(used_buffers) >= _BUFFER_DRAIN_BATCH:
+                            writer.drain()
+                            while used_buffers:
+                                _buffer_return(used_buffers.pop())
+                        buf = _buffer_checkout()
+                        view = memoryview(buf)
+                # Complete all queued writes before the descriptor closes
+                writer.drain()
+            finally:
+                _buffer_return(buf)
+                for used in used_buffers:
+                    _buffer_return(used)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _stored_data_offset(zip_fd: int, info: zipfile.ZipInfo) -> int:
+        """
+        Compute the file-data offset of a stored zip entry.
+
+        Reads the entry's 30-byte local file header to account for the
+        variable-length filename and extra fields.
+
+        Args:
+            zip_fd (int): Raw archive file descriptor
+            info (zipfile.ZipInfo): Entry whose data offset is needed
+
+        Returns:
+            int: Absolute offset of the entry's data within the archive
+        """
+        header = os.pread(zip_fd, 30, info.header_offset)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        return info.header_offset + 30 + name_length + extra_length
+
+    def _process_video(self, video_path: Path) -> List[str]:
         """
         Extract frames from a video file.
-        
-        Uses imageio-ffmpeg to extract frames from the video at specified
-        intervals. Limits the number of frames to prevent memory issues.
-        
+
+        Decodes via PyAV when installed (in-process libav with
+        multithreaded decode), otherwise through the imageio-ffmpeg
+        pipe. Both paths sample at frame_interval seconds and cap the
+        frame count to prevent memory issues.
+
         Args:
             video_path (Path): Path to the source video file
-            
+
         Returns:
-            List[Path]: List of paths to extracted frame images
+            List[str]: Paths of the extracted frame images
         """
         try:
-            logger.info(f"Processing video: {video_path.name}")
-            
+            logger.info("Processing video: %s", video_path.name)
+
             # Generate unique prefix for this video's frames
-            video_prefix = f"{uuid.uuid4()}_{video_path.stem}"
-            extracted_frames = []
-            
-            # Open video file
-            with imageio.get_reader(video_path) as reader:
-                # Get video metadata
-                fps = reader.get_meta_data()['fps']
-                duration = reader.get_meta_data()['duration']
-                
-                logger.info(f"Video info: {fps} fps, {duration:.2f} seconds")
-                
-                # Calculate frame indices to extract
-                frame_indices = self._calculate_frame_indices(fps, duration)
-                
-                # Extract frames
-                for i, frame_idx in enumerate(frame_indices):
-                    if i >= self.max_frames_per_video:
-                        break
-                    
-                    try:
-                        # Read frame
-                        frame = reader.get_data(frame_idx)
-                        
-                        # Save frame as image
-                        frame_filename = f"{video_prefix}_frame_{i:04d}.jpg"
-                        frame_path = self.output_dir / frame_filename
-                        
-                        imageio.imwrite(frame_path, frame)
-                        extracted_frames.append(frame_path)
-                        
-                        logger.debug(f"Extracted frame {i+1}/{len(frame_indices)}")
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to extract frame {frame_idx}: {e}")
-                        continue
-            
-            logger.info(f"Video processing complete: {len(extracted_frames)} frames extracted")
-            return extracted_frames
-            
+            video_prefix = f"{uuid.uuid4().hex}_{video_path.stem}"
+
+            if av is not None:
+                return self._extract_frames_pyav(video_path, video_prefix)
+            return self._extract_frames_ffmpeg(video_path, video_prefix)
+
         except Exception as e:
-            logger.error(f"Failed to process video {video_path}: {e}")
+            logger.error("Failed to process video %s: %s", video_path, e)
             return []
-    
-    def _calculate_frame_indices(self, fps: float, duration: float) -> List[int]:
+
+    def _extract_frames_pyav(self, source, video_prefix: str) -> List[str]:
         """
-        Calculate frame indices to extract based on interval and duration.
-        
-        Determines which frames to extract based on the frame interval
-        and video duration, ensuring we don't exceed the maximum frames limit.
-        
+        Decode sampled frames in-process with PyAV.
+
         Args:
-            fps (float): Frames per second of the video
-            duration (float): Duration of the video in seconds
-            
+            source: Path to the video file, or a seekable binary stream
+            video_prefix (str): Unique prefix for frame filenames
+
         Returns:
-            List[int]: List of frame indices to extract
+            List[str]: Paths of the extracted frame images
         """
-        # Calculate frame interval based on desired time interval
-        frame_interval = int(fps * self.frame_interval)
-        
-        # Calculate total number of frames
-        total_frames = int(duration * fps)
-        
-        # Generate frame indices
-        frame_indices = []
-        for i in range(0, total_frames, frame_interval):
-            if len(frame_indices) >= self.max_frames_per_video:
+        extracted_frames = []
+        encode_futures = []
+
+        with av.open(source if hasattr(source, "read") else str(source)) as container:
+            stream = container.streams.video[0]
+            # Turn on FFmpeg's internal slice/frame threading; decode()
+            # releases the GIL while it runs
+            stream.thread_type = 'AUTO'
+            time_base = float(stream.time_base) if stream.time_base else 0.0
+
+            next_target = 0.0
+            index = 0
+            encoder_pool = _encoder_pool()
+            for frame in container.decode(stream):
+                if index >= self.max_frames_per_video:
+                    break
+                if frame.pts is not None and time_base:
+                    timestamp = frame.pts * time_base
+                    if timestamp < next_target:
+                        continue
+                    next_target = timestamp + self.frame_interval
+                else:
+                    next_target += self.frame_interval
+
+                image = frame.to_ndarray(format='rgb24')
+                frame_path = f"{self._out_str}/{video_prefix}_frame_{index:04d}.jpg"
+                encode_futures.append(
+                    (frame_path, encoder_pool.submit(_write_jpeg, frame_path, image))
+                )
+                index += 1
+
+            for frame_path, future in encode_futures:
+                try:
+                    future.result()
+                    extracted_frames.append(frame_path)
+                except Exception as e:
+                    logger.warning("Failed to write frame %s: %s",
+                                   os.path.basename(frame_path), e)
+
+        logger.info("Video processing complete: %d frames extracted", len(extracted_frames))
+        return extracted_frames
+
+    def _extract_frames_ffmpeg(self, video_path: Path, video_prefix: str) -> List[str]:
+        """
+        Decode sampled frames through the imageio-ffmpeg pipe.
+
+        Args:
+            video_path (Path): Path to the source video file
+            video_prefix (str): Unique prefix for frame filenames
+
+        Returns:
+            List[str]: Paths of the extracted frame images
+        """
+        extracted_frames = []
+
+        # Let FFmpeg's fps filter do the sampling: only the frames
+        # we keep are decoded and piped out, instead of decoding the
+        # whole video and discarding most of it
+        frame_gen = imageio_ffmpeg.read_frames(
+            str(video_path),
+            output_params=["-vf", f"fps=1/{self.frame_interval}"]
+        )
+        meta = next(frame_gen)
+        width, height = meta["size"]
+        logger.info("Video info: %s fps, %.2f seconds",
+                    meta.get("fps"), meta.get("duration", 0.0))
+
+        # JPEG encoding overlaps the FFmpeg pipe: frames are handed to
+        # pool workers while the next frame is being decoded
+        encode_futures = []
+        encoder_pool = _encoder_pool()
+        for i, frame_bytes in enumerate(frame_gen):
+            if i >= self.max_frames_per_video:
                 break
-            frame_indices.append(i)
-        
-        logger.debug(f"Will extract {len(frame_indices)} frames from {total_frames} total frames")
-        return frame_indices
-    
+
+            frame = np.frombuffer(frame_bytes, np.uint8).reshape(
+                height, width, 3
+            )
+            frame_path = f"{self._out_str}/{video_prefix}_frame_{i:04d}.jpg"
+            encode_futures.append(
+                (frame_path, encoder_pool.submit(_write_jpeg, frame_path, frame))
+            )
+
+        for frame_path, future in encode_futures:
+            try:
+                future.result()
+                extracted_frames.append(frame_path)
+            except Exception as e:
+                logger.warning("Failed to write frame %s: %s",
+                               os.path.basename(frame_path), e)
+
+        logger.info("Video processing complete: %d frames extracted", len(extracted_frames))
+        return extracted_frames
+
     def get_processing_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the processing operation.
@@ -313,13 +748,14 @@ class MediaProcessor:
             "file_types": {}
         }
         
-        for file_path in self.output_dir.rglob("*"):
-            if file_path.is_file():
+        for entry in _scandir_recursive(self.output_dir):
+            if entry.is_file(follow_symlinks=False):
                 stats["total_files"] += 1
-                stats["total_size_bytes"] += file_path.stat().st_size
-                
+                # follow_symlinks=False reuses the stat cached on the entry
+                stats["total_size_bytes"] += entry.stat(follow_symlinks=False).st_size
+
                 # Count file types
-                extension = file_path.suffix.lower()
+                extension = os.path.splitext(entry.name)[1].lower()
                 stats["file_types"][extension] = stats["file_types"].get(extension, 0) + 1
         
         return stats
@@ -5,63 +5,183 @@ from torchvision import datasets, transforms
 
 class SimpleDataset(Dataset):
     def __init__(self, path):
-        self.dataset = datasets.FakeData(transform=transforms.ToTensor())  # placeholder for your dataset loader
+        dataset = datasets.FakeData(transform=transforms.PILToTensor())  # placeholder for your dataset loader
+        # materialize once: per-index PIL decode + ToTensor is the
+        # dominant CPU cost, and a resident tensor makes __getitem__ a
+        # pure slice. Samples stay uint8 (4x smaller over PCIe); the
+        # float cast and 1/255 scale run on the GPU after transfer
+        self.x = torch.stack([image for image, _ in dataset])
+        # pre-flatten: the model is Linear-only, so collation can build
+        # the contiguous [N, 150528] batch directly
+        self.x = self.x.reshape(self.x.size(0), -1)
+        self.y = torch.tensor([label for _, label in dataset])
 
     def __getitem__(self, index):
-        return self.dataset[index]
+        return self.x[index], self.y[index]
+
+    def __getitems__(self, indices):
+        # batched fetch: DataLoader passes the whole batch of indices,
+        # so two index_selects replace N getitem calls plus the
+        # collate-time stack
+        return self.x[indices], self.y[indices]
 
     def __len__(self):
-        return len(self.dataset)
+        return self.y.size(0)
 
 def load_dataset(path):
     return SimpleDataset(path)
 
 def load_model(model_path):
     model = nn.Sequential(
-        nn.Flatten(),
+        # samples arrive pre-flattened; Identity keeps the state-dict
+        # layer indices of the original Flatten-first checkpoint
+        nn.Identity(),
         nn.Linear(3*224*224, 128),
         nn.ReLU(),
         nn.Linear(128, 10)
     )
-    model.load_state_dict(torch.load(model_path, map_location='cpu'))
+    # mmap maps checkpoint pages lazily instead of materializing the
+    # whole state dict, and assign=True adopts those tensors directly
+    # rather than copying them into the parameters
+    state = torch.load(model_path, map_location='cpu', mmap=True, weights_only=True)
+    model.load_state_dict(state, assign=True)
     return model
 
-def evaluate_model(model, dataset):
-    loader = DataLoader(dataset, batch_size=16)
+def _maybe_compile(model):
+    # reduce-overhead fuses the Linear+ReLU kernels and wraps steps in
+    # CUDA graphs; the first call pays a compile warm-up, so fall back
+    # to eager if the backend cannot handle the model
+    if not hasattr(torch, 'compile'):
+        return model
+    try:
+        return torch.compile(model, mode='reduce-overhead', fullgraph=True)
+    except Exception:
+        return model
+
+def _set_cuda_flags(device):
+    # shapes are fixed, so cuDNN can autotune kernels once; TF32 puts
+    # the fp32 matmuls outside autocast onto tensor cores
+    if device == 'cuda':
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.set_float32_matmul_precision('high')
+
+def _identity_collate(batch):
+    # __getitems__ already returns stacked tensors
+    return batch
+
+def _maybe_script(model):
+    # scripting strips per-op Python dispatch from the fixed eval graph
+    # and optimize_for_inference freezes and fuses it; the first batch
+    # absorbs the compilation. Falls back to torch.compile, then eager.
+    try:
+        return torch.jit.optimize_for_inference(torch.jit.script(model))
+    except Exception:
+        return _maybe_compile(model)
+
+def _loader_kwargs(num_workers, prefetch_factor):
+    # prefetch_factor / persistent_workers are only legal with workers
+    if num_workers == 0:
+        return {"num_workers": 0}
+    return {
+        "num_workers": num_workers,
+        "prefetch_factor": prefetch_factor,
+        "persistent_workers": True,
+    }
+
+def evaluate_model(model, dataset, batch_size=256,
+                   device='cuda' if torch.cuda.is_available() else 'cpu',
+                   num_workers=0, prefetch_factor=4):
+    _set_cuda_flags(device)
+    # inference has no statistical batch-size constraint, so default
+    # large and cut the per-batch launch and interpreter overhead
+    loader = DataLoader(dataset, batch_size=batch_size, drop_last=False,
+                        pin_memory=(device == 'cuda'), collate_fn=_identity_collate,
+                        **_loader_kwargs(num_workers, prefetch_factor))
     criterion = nn.CrossEntropyLoss()
-    correct = 0
+    nb = len(loader)
+    correct = torch.zeros((), dtype=torch.long, device=device)
     total = 0
-    total_loss = 0
+    total_loss = torch.zeros((), device=device)
+    model = model.to(device)
     model.eval()
-    with torch.no_grad():
+    model = _maybe_script(model)
+    use_amp = device == 'cuda'
+    amp_dtype = torch.bfloat16 if use_amp and torch.cuda.is_bf16_supported() else torch.float16
+    # inference_mode also skips view/version-counter tracking that
+    # no_grad still pays per op
+    with torch.inference_mode():
         for inputs, targets in loader:
-            outputs = model(inputs)
-            loss = criterion(outputs, targets)
-            total_loss += loss.item()
-            _, predicted = torch.max(outputs.data, 1)
+            inputs = inputs.to(device, non_blocking=True)
+            targets = targets.to(device, non_blocking=True)
+            inputs = inputs.float().mul_(1.0 / 255.0)
+            with torch.cuda.amp.autocast(enabled=use_amp, dtype=amp_dtype):
+                outputs = model(inputs)
+                loss = criterion(outputs, targets)
+            # accumulate on device; .item() below syncs once, not per batch
+            total_loss += loss.detach()
             total += targets.size(0)
-            correct += (predicted == targets).sum().item()
-    accuracy = correct / total
-    avg_loss = total_loss / len(loader)
+            correct += (outputs.argmax(dim=1) == targets).sum()
+    accuracy = correct.item() / total
+    avg_loss = (total_loss / nb).item()
     return {"accuracy": accuracy, "loss": avg_loss}
 
-def train_model(model, train_dataset, epochs=1, batch_size=16, lr=1e-4, device='cuda' if torch.cuda.is_available() else 'cpu'):
-    dataloader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True, num_workers=4)
+def train_model(model, train_dataset, epochs=1, batch_size=16, lr=1e-4,
+                device='cuda' if torch.cuda.is_available() else 'cpu',
+                num_workers=0, prefetch_factor=4, accum_steps=1):
+    _set_cuda_flags(device)
+    # fixed shapes every step: a ragged final batch would force the
+    # CUDA-graph path in torch.compile to recapture or fall back
+    dataloader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True,
+                            drop_last=True, pin_memory=(device == 'cuda'),
+                            collate_fn=_identity_collate,
+                            **_loader_kwargs(num_workers, prefetch_factor))
     model = model.to(device)
     model.train()
+    # compile into a separate reference: parameters are shared, but the
+    # OptimizedModule wrapper prefixes state-dict keys with _orig_mod.,
+    # so the plain module is what gets returned (and saved) below
+    compiled = _maybe_compile(model)
     criterion = nn.CrossEntropyLoss()
-    optimizer = optim.Adam(model.parameters(), lr=lr)
+    # the fused kernel folds the dozen elementwise Adam ops per tensor
+    # into one launch; older builds without it get the foreach batching
+    try:
+        optimizer = optim.Adam(model.parameters(), lr=lr, fused=(device == 'cuda'))
+    except (TypeError, RuntimeError):
+        optimizer = optim.Adam(model.parameters(), lr=lr, foreach=True)
+    use_amp = device == 'cuda'
+    # bf16 has fp32 range, so loss scaling is unnecessary on hardware
+    # that supports it; the disabled scaler degrades to plain
+    # backward/step without branching the loop
+    use_bf16 = use_amp and torch.cuda.is_bf16_supported()
+    amp_dtype = torch.bfloat16 if use_bf16 else torch.float16
+    scaler = torch.cuda.amp.GradScaler(enabled=use_amp and not use_bf16)
+    optimizer.zero_grad(set_to_none=True)
+    nb = len(dataloader)
 
     for epoch in range(epochs):
-        epoch_loss = 0.0
-        for inputs, targets in dataloader:
-            inputs, targets = inputs.to(device), targets.to(device)
-            optimizer.zero_grad()
-            outputs = model(inputs)
-            loss = criterion(outputs, targets)
-            loss.backward()
-            optimizer.step()
-            epoch_loss += loss.item()
-        print(f"Epoch {epoch+1}/{epochs}, Loss: {epoch_loss / len(dataloader):.4f}")
+        epoch_loss = torch.zeros((), device=device)
+        for step, (inputs, targets) in enumerate(dataloader):
+            inputs = inputs.to(device, non_blocking=True)
+            targets = targets.to(device, non_blocking=True)
+            inputs = inputs.float().mul_(1.0 / 255.0)
+            with torch.cuda.amp.autocast(enabled=use_amp, dtype=amp_dtype):
+                outputs = compiled(inputs)
+                loss = criterion(outputs, targets)
+            epoch_loss += loss.detach()
+            # amortize optimizer.step() over accum_steps micro-batches
+            scaler.scale(loss / accum_steps).backward()
+            if (step + 1) % accum_steps == 0:
+                scaler.step(optimizer)
+                scaler.update()
+                optimizer.zero_grad(set_to_none=True)
+        if nb % accum_steps:
+            # flush the trailing partial group so its gradients are
+            # neither carried into the next epoch nor dropped after
+            # the last one
+            scaler.step(optimizer)
+            scaler.update()
+            optimizer.zero_grad(set_to_none=True)
+        print(f"Epoch {epoch+1}/{epochs}, Loss: {(epoch_loss / nb).item():.4f}")
 
     return model
@@ -0,0 +1,191 @@
+"""
+io_uring Write Backend for AI Model Improver
+
+This module provides an optional batched file writer backed by io_uring
+(via the liburing PyPI wrapper). Batching many write submissions per
+syscall removes per-write kernel-entry overhead, which matters when
+extracting archives containing thousands of files.
+
+The backend is entirely optional: when liburing is not installed or the
+kernel does not support io_uring, UringWriter degrades to plain pwrite
+calls with identical semantics.
+
+Author: AI Model Improver Team
+Version: 1.0.0
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+try:
+    import liburing
+    URING_AVAILABLE = True
+except ImportError:
+    liburing = None
+    URING_AVAILABLE = False
+
+# Submission queue depth for each ring
+QUEUE_DEPTH = 256
+
+# Number of queued writes accumulated before an io_uring_submit call
+MAX_BATCH = 64
+
+# Size and count of pre-registered fixed buffers
+FIXED_BUFFER_SIZE = 1 << 20
+FIXED_BUFFER_COUNT = 16
+
+# IORING_OP_WRITE_FIXED requires kernel 5.7+, so registered buffers stay
+# behind an explicit opt-in flag
+USE_FIXED_BUFFERS = os.environ.get("URING_FIXED_BUFFERS", "0") == "1"
+
+
+class UringWriter:
+    """
+    Batched positional file writer.
+
+    Writes are queued as io_uring submission entries and flushed in
+    batches of MAX_BATCH, so many file writes share a single syscall.
+    Callers must invoke drain() before closing a file descriptor that
+    still has queued writes, and close() when finished with the writer.
+
+    When liburing is unavailable, every submit_write falls back to an
+    immediate os.pwrite and drain()/close() become no-ops.
+    """
+
+    def __init__(self, queue_depth: int = QUEUE_DEPTH):
+        """
+        Initialize the writer and, if possible, the io_uring queue.
+
+        Args:
+            queue_depth (int): Submission queue depth for the ring
+        """
+        self._pending = 0
+        # Keep references to queued buffers until their writes complete
+        self._buffers = []
+        # Pre-registered buffer pool for IORING_OP_WRITE_FIXED
+        self._fixed_buffers = None
+        self._free_fixed = []
+        # Maps in-flight user_data values to fixed buffer indices
+        self._in_flight_fixed = {}
+
+        if URING_AVAILABLE:
+            try:
+                self._ring = liburing.io_uring()
+                liburing.io_uring_queue_init(queue_depth, self._ring, 0)
+                logger.debug("io_uring write backend initialized")
+            except OSError as e:
+                # Kernel too old or io_uring disabled; fall back
+                logger.info("io_uring unavailable, using pwrite fallback: %s", e)
+                self._ring = None
+        else:
+            self._ring = None
+
+        if self._ring is not None and USE_FIXED_BUFFERS:
+            self._register_fixed_buffers()
+
+    @property
+    def synchronous(self) -> bool:
+        """
+        Whether writes complete before submit_write returns.
+
+        True in the pwrite fallback, where callers may reuse a buffer
+        immediately; False when writes are queued on the ring and the
+        buffer must stay alive until the next drain().
+        """
+        return self._ring is None
+
+    def _register_fixed_buffers(self) -> None:
+        """
+        Register a pool of fixed 1 MiB buffers with the ring.
+
+        Registered buffers skip per-write pinning and pointer validation
+        in the kernel. On any registration failure the writer silently
+        keeps using plain (unregistered) writes.
+        """
+        try:
+            buffers = [bytearray(FIXED_BUFFER_SIZE) for _ in range(FIXED_BUFFER_COUNT)]
+            iovecs = liburing.iovec(*buffers)
+            liburing.io_uring_register_buffers(self._ring, iovecs, FIXED_BUFFER_COUNT)
+            self._fixed_buffers = buffers
+            self._free_fixed = list(range(FIXED_BUFFER_COUNT))
+            logger.debug("Registered %d fixed io_uring buffers", FIXED_BUFFER_COUNT)
+        except (OSError, AttributeError) as e:
+            logger.info("Fixed-buffer registration unavailable: %s", e)
+            self._fixed_buffers = None
+            self._free_fixed = []
+
+    def submit_write(self, fd: int, data: bytes, offset: int) -> None:
+        """
+        Queue a positional write, flushing when the batch is full.
+
+        Args:
+            fd (int): Open file descriptor to write to
+            data (bytes): Buffer to write
+            offset (int): File offset for the write
+        """
+        if self._ring is None:
+            os.pwrite(fd, data, offset)
+            return
+
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if (
+            self._fixed_buffers is not None
+            and self._free_fixed
+            and len(data) <= FIXED_BUFFER_SIZE
+        ):
+            # Copy into a registered buffer and submit a WRITE_FIXED;
+            # the buffer index is recycled when its completion is reaped
+            index = self._free_fixed.pop()
+            buffer = self._fixed_buffers[index]
+            buffer[:len(data)] = data
+            liburing.io_uring_prep_write_fixed(
+                sqe, fd, buffer, len(data), offset, index
+            )
+            sqe.user_data = index + 1
+            self._in_flight_fixed[index + 1] = index
+        else:
+            liburing.io_uring_prep_write(sqe, fd, data, len(data), offset)
+            sqe.user_data = 0
+            self._buffers.append(data)
+        self._pending += 1
+
+        if self._pending >= MAX_BATCH:
+            self.drain()
+
+    def drain(self) -> None:
+        """
+        Submit all queued writes and wait for their completions.
+
+        Raises:
+            OSError: If any queued write completed with an error
+        """
+        if self._ring is None or self._pending == 0:
+            return
+
+        liburing.io_uring_submit(self._ring)
+        cqe = liburing.io_uring_cqe()
+        error = None
+        for _ in range(self._pending):
+            liburing.io_uring_wait_cqe(self._ring, cqe)
+            result = cqe.res
+            # Recycle the fixed buffer tied to this completion, if any
+            fixed_index = self._in_flight_fixed.pop(cqe.user_data, None)
+            if fixed_index is not None:
+                self._free_fixed.append(fixed_index)
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+            if result < 0 and error is None:
+                error = OSError(-result, os.strerror(-result))
+
+        self._pending = 0
+        self._buffers.clear()
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush any queued writes and release the ring."""
+        self.drain()
+        if self._ring is not None:
+            liburing.io_uring_queue_exit(self._ring)
+            self._ring = None